@@ -27,16 +27,22 @@ def create_app():
     historical_df = data_manager.generate_training_history()
     anomaly_model.train(historical_df)
 
+    # Seed per-region weather aggregates once; requests only read them
+    data_manager.ingest_weather_archive()
+
     @app.route("/", methods=["GET", "POST"])
     def index():
         if request.method == "POST":
             try:
-                region = request.form.get("region") or "Region-001"
+                region = request.form.get("region") or Config.REGIONS[0]
                 crop = request.form.get("crop") or "Maize"
                 user_event = request.form.get("user_event") or ""
                 scenario = request.form.get("scenario") or "baseline"
 
-                weather_series = data_manager.load_weather_series(region=region)
+                data_manager.refresh_weather(region=region)
+                weather_series = data_manager.load_weather_window(
+                    region=region, days=Config.WEATHER_WINDOW_DAYS
+                )
                 ndvi_series = data_manager.load_ndvi_series(region=region)
                 soil_terrain = data_manager.load_soil_terrain(region=region)
                 climate_indices = data_manager.load_climate_indices(region=region)
@@ -44,6 +50,7 @@ def create_app():
                 bulletins = data_manager.load_bulletins(region=region)
                 crop_patterns = data_manager.load_crop_patterns(region=region)
                 commons_data = data_manager.load_metadata()
+                climatology = data_manager.load_weather_climatology(region=region)
 
                 temporal_out = temporal_model.forecast_anomalies(
                     weather_series=weather_series,
@@ -83,6 +90,7 @@ def create_app():
                     anomaly_flags=anomaly_flags,
                     impact_out=impact_out,
                     output_path=img_path,
+                    climatology=climatology,
                 )
 
                 metrics = {
@@ -112,19 +120,11 @@ def create_app():
             except Exception as e:
                 flash(f"Climate anomaly analysis failed: {e}", "danger")  # noqa: E501
 
-        regions = ["Region-001", "Region-002", "Highland-Belt", "River-Valley"]
-        crops = ["Maize", "Wheat", "Rice", "Soybean", "Cotton"]
-        scenarios = [
-            ("baseline", "Baseline"),
-            ("hotter", "Warmer than normal"),
-            ("drier", "Drier than normal"),
-            ("wetter", "Wetter than normal"),
-        ]
         return render_template(
             "index.html",
-            regions=regions,
-            crops=crops,
-            scenarios=scenarios,
+            regions=Config.REGIONS,
+            crops=Config.CROPS,
+            scenarios=Config.SCENARIOS,
         )
 
     @app.route("/api/health")
@@ -0,0 +1,402 @@
+"""Local load-testing harness for the climate anomaly app.
+
+Starts ``app:create_app()`` under gunicorn for every combination of worker
+count and worker class, replays a mix of ``/`` form posts and ``/api/health``
+calls, and reports throughput, latency percentiles, error rate and per-worker
+RSS growth.
+
+Example:
+    python loadtest.py --workers 1,2,4 --worker-classes sync,gthread \
+        --concurrency 8 --requests 300
+
+Only the standard library is used on the client side; gunicorn must be
+installed (it is in the Docker image). RSS is read from ``/proc`` so memory
+figures are only available on Linux; elsewhere they are reported as n/a.
+PNGs the app writes to ``static/generated/`` during a case are deleted
+once it has been measured.
+"""
+import argparse
+import http.client
+import importlib.util
+import math
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GENERATED_DIR = os.path.join(BASE_DIR, "static", "generated")
+HAS_PROC = os.path.isdir("/proc")
+
+
+def _load_config():
+    # Load models/config.py on its own: importing the models package would
+    # pull in pandas/matplotlib, which the client side does not need
+    spec = importlib.util.spec_from_file_location("_loadtest_config", os.path.join(BASE_DIR, "models", "config.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Config
+
+
+Config = _load_config()
+
+# Form choices are the ones rendered by the index route in app.py
+REGIONS = Config.REGIONS
+CROPS = Config.CROPS
+SCENARIOS = [key for key, _ in Config.SCENARIOS]
+USER_EVENTS = ["", "", "", "Hailstorm damaged the north field", "River overflowed after heavy rain"]
+
+# The index route swallows exceptions and re-renders the form with a flash
+FAILURE_MARKER = b"Climate anomaly analysis failed"
+
+
+# -------- process helpers ----------
+def _read_rss_kb(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def _child_pids(parent_pid: int) -> List[int]:
+    children = []
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return children
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status") as fh:
+                for line in fh:
+                    if line.startswith("PPid:"):
+                        if int(line.split()[1]) == parent_pid:
+                            children.append(int(entry))
+                        break
+        except (OSError, ValueError):
+            continue
+    return sorted(children)
+
+
+def _worker_rss(master_pid: int) -> Dict[int, int]:
+    rss = {}
+    for pid in _child_pids(master_pid):
+        kb = _read_rss_kb(pid)
+        if kb is not None:
+            rss[pid] = kb
+    return rss
+
+
+def _wait_for_stable_rss(master_pid: int, timeout: float, interval: float = 1.0,
+                         tolerance_kb: int = 1024, samples: int = 3) -> None:
+    """Block until no worker's RSS moves by more than ``tolerance_kb`` for ``samples`` polls.
+
+    Workers finish ``create_app()`` (model training, archive seeding) at
+    different times; sampling before they settle would count boot-time
+    allocation as growth.
+    """
+    if not HAS_PROC:
+        return
+    deadline = time.time() + timeout
+    previous = _worker_rss(master_pid)
+    steady = 0
+    while time.time() < deadline and steady < samples:
+        time.sleep(interval)
+        current = _worker_rss(master_pid)
+        stable = current.keys() == previous.keys() and all(
+            abs(current[pid] - previous[pid]) <= tolerance_kb for pid in current
+        )
+        steady = steady + 1 if stable else 0
+        previous = current
+    if steady < samples:
+        raise RuntimeError(f"worker RSS did not settle within {timeout:.0f}s")
+
+
+def _generated_files() -> Dict[str, int]:
+    """Map of file name -> size for everything currently in static/generated."""
+    files = {}
+    if os.path.isdir(GENERATED_DIR):
+        for name in os.listdir(GENERATED_DIR):
+            path = os.path.join(GENERATED_DIR, name)
+            if os.path.isfile(path):
+                files[name] = os.path.getsize(path)
+    return files
+
+
+def _remove_generated(keep: Dict[str, int]) -> None:
+    for name in set(_generated_files()) - set(keep):
+        try:
+            os.remove(os.path.join(GENERATED_DIR, name))
+        except OSError:
+            pass
+
+
+# -------- gunicorn lifecycle ----------
+def start_server(workers: int, worker_class: str, threads: int, port: int) -> subprocess.Popen:
+    cmd = [
+        sys.executable, "-m", "gunicorn",
+        "-b", f"127.0.0.1:{port}",
+        "-w", str(workers),
+        "-k", worker_class,
+        "--timeout", "120",
+        "--log-level", "warning",
+    ]
+    if worker_class == "gthread":
+        cmd += ["--threads", str(threads)]
+    cmd.append("app:create_app()")
+    # Log to a file rather than a pipe so a chatty server can never block on a full buffer
+    log = tempfile.TemporaryFile()
+    proc = subprocess.Popen(cmd, cwd=BASE_DIR, stdout=subprocess.DEVNULL, stderr=log)
+    proc.log = log
+    return proc
+
+
+def wait_until_ready(proc: subprocess.Popen, base_url: str, workers: int, timeout: float) -> None:
+    """Block until the health endpoint answers and all workers have booted."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            proc.log.seek(0)
+            err = proc.log.read().decode(errors="replace")
+            raise RuntimeError(f"gunicorn exited with code {proc.returncode}: {err.strip()[-500:]}")
+        try:
+            with urllib.request.urlopen(f"{base_url}/api/health", timeout=2) as resp:
+                # Without /proc the worker count cannot be checked; the RSS wait is skipped too
+                if resp.status == 200 and (not HAS_PROC or len(_child_pids(proc.pid)) >= workers):
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"gunicorn not ready after {timeout:.0f}s")
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    proc.log.close()
+
+
+# -------- load generation ----------
+def _one_request(base_url: str, post_ratio: float, rng: random.Random, timeout: float) -> Dict:
+    if rng.random() < post_ratio:
+        kind = "post"
+        payload = urllib.parse.urlencode(
+            {
+                "region": rng.choice(REGIONS),
+                "crop": rng.choice(CROPS),
+                "scenario": rng.choice(SCENARIOS),
+                "user_event": rng.choice(USER_EVENTS),
+            }
+        ).encode()
+        req = urllib.request.Request(f"{base_url}/", data=payload, method="POST")
+    else:
+        kind = "health"
+        req = urllib.request.Request(f"{base_url}/api/health")
+
+    start = time.perf_counter()
+    ok = False
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            body = resp.read()
+            ok = resp.status == 200 and (kind != "post" or FAILURE_MARKER not in body)
+    except (urllib.error.URLError, http.client.HTTPException, OSError):
+        # Includes responses cut short by a worker killed mid-request
+        ok = False
+    return {"kind": kind, "latency": time.perf_counter() - start, "ok": ok}
+
+
+def run_load(base_url: str, total: int, concurrency: int, post_ratio: float, timeout: float, seed: int) -> Dict:
+    lock = threading.Lock()
+    counter = {"next": 0}
+    results: List[Dict] = []
+
+    def worker(idx: int):
+        rng = random.Random(seed + idx)
+        while True:
+            with lock:
+                if counter["next"] >= total:
+                    break
+                counter["next"] += 1
+            result = _one_request(base_url, post_ratio, rng, timeout)
+            with lock:
+                results.append(result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(worker, i) for i in range(concurrency)]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - start
+    return {"results": results, "elapsed": elapsed}
+
+
+def _percentile(sorted_vals: List[float], pct: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = max(0, min(len(sorted_vals) - 1, math.ceil(pct / 100.0 * len(sorted_vals)) - 1))
+    return sorted_vals[k]
+
+
+def summarize(load: Dict, rss_before: Dict[int, int], rss_after: Dict[int, int]) -> Dict:
+    results = load["results"]
+    latencies = sorted(r["latency"] for r in results)
+    errors = sum(1 for r in results if not r["ok"])
+    growth_mb = [
+        (rss_after[pid] - rss_before[pid]) / 1024.0
+        for pid in rss_before
+        if pid in rss_after
+    ]
+    return {
+        "requests": len(results),
+        "rps": len(results) / load["elapsed"] if load["elapsed"] > 0 else 0.0,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "error_rate": errors / len(results) if results else 0.0,
+        "rss_start_mb": statistics.mean(rss_before.values()) / 1024.0 if rss_before else None,
+        "rss_growth_mean_mb": statistics.mean(growth_mb) if growth_mb else None,
+        "rss_growth_max_mb": max(growth_mb) if growth_mb else None,
+        "workers_recycled": len(set(rss_before) - set(rss_after)) if HAS_PROC else None,
+    }
+
+
+def run_case(args, workers: int, worker_class: str) -> Dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    preexisting = _generated_files()
+    proc = start_server(workers, worker_class, args.threads, args.port)
+    try:
+        wait_until_ready(proc, base_url, workers, args.startup_timeout)
+        _wait_for_stable_rss(proc.pid, args.startup_timeout)
+        if args.warmup:
+            run_load(base_url, args.warmup, args.concurrency, args.post_ratio, args.timeout, args.seed)
+        rss_before = _worker_rss(proc.pid)
+        disk_before = _generated_files()
+        load = run_load(base_url, args.requests, args.concurrency, args.post_ratio, args.timeout, args.seed)
+        rss_after = _worker_rss(proc.pid)
+        disk_after = _generated_files()
+    finally:
+        stop_server(proc)
+        _remove_generated(keep=preexisting)
+
+    new_files = set(disk_after) - set(disk_before)
+    summary = summarize(load, rss_before, rss_after)
+    summary["generated_files"] = len(new_files)
+    summary["generated_mb"] = sum(disk_after[name] for name in new_files) / (1024.0 * 1024.0)
+    return summary
+
+
+# -------- reporting ----------
+COLUMNS = [
+    ("class", 8, "<"),
+    ("workers", 7, ">"),
+    ("req/s", 8, ">.1f"),
+    ("p50ms", 8, ">.0f"),
+    ("p95ms", 8, ">.0f"),
+    ("p99ms", 8, ">.0f"),
+    ("err%", 6, ">.1f"),
+    ("rss0MB", 7, ">.0f"),
+    ("+rssMB", 7, ">.1f"),
+    ("+maxMB", 7, ">.1f"),
+    ("+png", 6, ">"),
+    ("+pngMB", 7, ">.1f"),
+    ("recyc", 6, ">"),
+]
+
+
+def print_report(rows: List[Dict]) -> None:
+    header = " ".join(f"{name:{spec[0]}{width}}" for name, width, spec in COLUMNS)
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        if "error" in row:
+            print(f"{row['worker_class']:<8} {row['workers']:>7}  FAILED: {row['error']}")
+            continue
+        values = [
+            row["worker_class"],
+            row["workers"],
+            row["rps"],
+            row["p50_ms"],
+            row["p95_ms"],
+            row["p99_ms"],
+            row["error_rate"] * 100,
+            row["rss_start_mb"],
+            row["rss_growth_mean_mb"],
+            row["rss_growth_max_mb"],
+            row["generated_files"],
+            row["generated_mb"],
+            row["workers_recycled"],
+        ]
+        line = " ".join(
+            f"{'n/a':{spec[0]}{width}}" if v is None else f"{v:{spec[0]}{width}{spec[1:]}}"
+            for (_, width, spec), v in zip(COLUMNS, values)
+        )
+        if row["workers_recycled"]:
+            # Replaced workers drop out of the RSS growth figures
+            line += "  * RSS growth excludes recycled workers"
+        print(line)
+
+
+def _csv_ints(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def _csv_strs(value: str) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep gunicorn worker models against the climate anomaly app.")
+    parser.add_argument("--workers", type=_csv_ints, default=[1, 2, 4], help="comma-separated worker counts")
+    parser.add_argument("--worker-classes", type=_csv_strs, default=["sync", "gthread"],
+                        help="comma-separated gunicorn worker classes")
+    parser.add_argument("--threads", type=int, default=4, help="threads per worker for gthread")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent client connections")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per case")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests before sampling RSS")
+    parser.add_argument("--post-ratio", type=float, default=0.3, help="fraction of requests that are form posts")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-request timeout in seconds")
+    parser.add_argument("--startup-timeout", type=float, default=180.0)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    rows = []
+    for worker_class in args.worker_classes:
+        for workers in args.workers:
+            print(f"running {worker_class} x{workers} ...", file=sys.stderr)
+            try:
+                row = run_case(args, workers, worker_class)
+            except RuntimeError as e:
+                row = {"error": str(e)}
+            row["worker_class"] = worker_class
+            row["workers"] = workers
+            rows.append(row)
+    print_report(rows)
+    return 1 if any("error" in r for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from .config import Config
 from .data_loader import ClimateDataManager
+from .timeseries_pyramid import TimeSeriesPyramid
 from .temporal_model import ClimateTemporalModel
 from .anomaly_model import ClimateAnomalyModel
 from .impact_model import ImpactAssessor
@@ -12,5 +12,15 @@ class Config:
 
     DAYS_HISTORY = 365 * 3
     DAYS_FORECAST = 60
+    # Widest raw window any consumer reads (the 120-day chart)
+    WEATHER_WINDOW_DAYS = 120
+    REGIONS = ["Region-001", "Region-002", "Highland-Belt", "River-Valley"]
+    CROPS = ["Maize", "Wheat", "Rice", "Soybean", "Cotton"]
+    SCENARIOS = [
+        ("baseline", "Baseline"),
+        ("hotter", "Warmer than normal"),
+        ("drier", "Drier than normal"),
+        ("wetter", "Wetter than normal"),
+    ]
     IMG_WIDTH = 1100
     IMG_HEIGHT = 650
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Dict
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Iterable, Optional, Union
 import random
+import threading
 import pandas as pd
+from .timeseries_pyramid import TimeSeriesPyramid
 
 @dataclass
 class WeatherPoint:
@@ -30,8 +32,13 @@ class ClimateDataManager:
     - NASA FIRMS / global flood datasets
     """
 
+    WEATHER_FIELDS = ("tavg", "rain", "wind")
+
     def __init__(self, config_cls):
         self.cfg = config_cls
+        self.weather_pyramids: Dict[str, TimeSeriesPyramid] = {}
+        self._pyramids_lock = threading.Lock()
+        self._ingest_lock = threading.Lock()
 
     # -------- training history for anomaly model ----------
     def generate_training_history(self) -> pd.DataFrame:
@@ -61,18 +68,102 @@ class ClimateDataManager:
         import math
         return math.sin(2 * math.pi * day_of_year / 365.0)
 
+    # -------- pre-aggregated weather pyramid ----------
+    def _weather_pyramid(self, region: str) -> TimeSeriesPyramid:
+        if region not in self.cfg.REGIONS:
+            raise ValueError(f"Unknown region '{region}'")
+        with self._pyramids_lock:
+            pyramid = self.weather_pyramids.get(region)
+            if pyramid is None:
+                pyramid = TimeSeriesPyramid(self.WEATHER_FIELDS)
+                self.weather_pyramids[region] = pyramid
+            return pyramid
+
+    def ingest_weather(self, region: str, series: Iterable[WeatherPoint]) -> int:
+        """Fold weather samples (any frequency, any order) into the region's aggregates.
+
+        Only regions listed in ``Config.REGIONS`` are accepted, so the number of
+        aggregates held in memory stays bounded. Samples are not de-duplicated:
+        ingest each sample exactly once. Returns the number of samples ingested.
+        """
+        pyramid = self._weather_pyramid(region)
+        ingested = 0
+        for p in series:
+            pyramid.ingest(p.date, {"tavg": p.tavg, "rain": p.rain, "wind": p.wind})
+            ingested += 1
+        return ingested
+
+    def refresh_weather(self, region: str) -> int:
+        """Ingest the days observed since the region's last sample.
+
+        An empty region is seeded with ``DAYS_HISTORY`` days; afterwards only
+        the days after ``last_timestamp`` up to yesterday are added.
+        """
+        pyramid = self._weather_pyramid(region)
+        today = datetime.combine(date.today(), datetime.min.time())
+        with self._ingest_lock:
+            if pyramid.last_timestamp is None:
+                first = today - timedelta(days=self.cfg.DAYS_HISTORY)
+            else:
+                first = datetime.combine(pyramid.last_timestamp.date(), datetime.min.time()) + timedelta(days=1)
+            days = (today - first).days
+            series = [self._synthetic_weather_point(first + timedelta(days=i)) for i in range(days)]
+            return self.ingest_weather(region, series)
+
+    def ingest_weather_archive(self) -> int:
+        """Seed every known region's aggregates with its weather history (startup step)."""
+        return sum(self.refresh_weather(region) for region in self.cfg.REGIONS)
+
+    def query_weather_aggregates(
+        self,
+        region: str,
+        start: Union[date, datetime],
+        end: Union[date, datetime],
+        resolution: Union[str, int, timedelta] = "daily",
+    ) -> List[Dict]:
+        """Windowed weather buckets from the coarsest level meeting ``resolution``."""
+        pyramid = self.weather_pyramids.get(region)
+        if pyramid is None:
+            return []
+        return pyramid.query(start, end, resolution)
+
+    def load_weather_window(self, region: str, days: int) -> List[WeatherPoint]:
+        """Daily weather for the last ``days`` days, served from the daily aggregates.
+
+        Costs O(days) regardless of how long the ingested history is; rain is
+        the daily total, temperature and wind the daily means.
+        """
+        end = date.today()
+        series: List[WeatherPoint] = []
+        for row in self.query_weather_aggregates(region, end - timedelta(days=days), end, "daily"):
+            series.append(
+                WeatherPoint(
+                    date=datetime.combine(row["start"], datetime.min.time()),
+                    tavg=row["tavg"]["mean"],
+                    rain=row["rain"]["sum"],
+                    wind=row["wind"]["mean"],
+                )
+            )
+        return series
+
+    def load_weather_climatology(self, region: str) -> Dict[int, Dict[str, Dict]]:
+        """Per-calendar-month weather statistics from the monthly aggregates."""
+        pyramid = self.weather_pyramids.get(region)
+        if pyramid is None:
+            return {}
+        return pyramid.climatology()
+
     # -------- main loaders ----------
+    def _synthetic_weather_point(self, d: datetime) -> WeatherPoint:
+        temp = 20 + 8 * self._season_factor(d.timetuple().tm_yday) + random.gauss(0, 1.5)
+        rain = max(0.0, random.gauss(2.0, 4.0))
+        wind = max(0.5, random.gauss(3.0, 1.0))
+        return WeatherPoint(date=d, tavg=temp, rain=rain, wind=wind)
+
     def load_weather_series(self, region: str) -> List[WeatherPoint]:
         today = datetime.today()
         start = today - timedelta(days=self.cfg.DAYS_HISTORY)
-        series: List[WeatherPoint] = []
-        for i in range(self.cfg.DAYS_HISTORY):
-            d = start + timedelta(days=i)
-            temp = 20 + 8 * self._season_factor(d.timetuple().tm_yday) + random.gauss(0, 1.5)
-            rain = max(0.0, random.gauss(2.0, 4.0))
-            wind = max(0.5, random.gauss(3.0, 1.0))
-            series.append(WeatherPoint(date=d, tavg=temp, rain=rain, wind=wind))
-        return series
+        return [self._synthetic_weather_point(start + timedelta(days=i)) for i in range(self.cfg.DAYS_HISTORY)]
 
     def load_ndvi_series(self, region: str) -> List[NDVIPoint]:
         today = datetime.today()
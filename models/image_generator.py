@@ -1,5 +1,5 @@
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -20,6 +20,7 @@ class ClimateImageGenerator:
         anomaly_flags: Dict,
         impact_out: Dict,
         output_path: str,
+        climatology: Optional[Dict[int, Dict[str, Dict]]] = None,
     ):
         last_weather = weather_series[-120:]
         dates = [p.date for p in last_weather]
@@ -42,6 +43,10 @@ class ClimateImageGenerator:
         ax1, ax2, ax3, ax4 = axes.ravel()
 
         ax1.plot(dates, temps, label="Tavg (°C)")
+        if climatology:
+            clim_temps = [climatology.get(d.month, {}).get("tavg", {}).get("mean") for d in dates]
+            ax1.plot(dates, clim_temps, linestyle="--", label="Monthly climatology")
+            ax1.legend(loc="upper left")
         ax1.set_ylabel("Temp (°C)")
         ax1_twin = ax1.twinx()
         ax1_twin.bar(dates, rain, alpha=0.3)
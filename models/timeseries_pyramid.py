@@ -0,0 +1,180 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import bisect
+import math
+import threading
+
+# Level name -> upper bound on bucket width in days (months are taken at 31)
+LEVELS: Tuple[Tuple[str, int], ...] = (("daily", 1), ("weekly", 7), ("monthly", 31))
+
+
+@dataclass
+class AggregateStats:
+    count: int = 0
+    sum: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def add(self, value: float):
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "AggregateStats"):
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> Dict:
+        if not self.count:
+            return {"mean": None, "sum": 0.0, "min": None, "max": None, "count": 0}
+        return {"mean": self.mean, "sum": self.sum, "min": self.min, "max": self.max, "count": self.count}
+
+
+@dataclass
+class _Level:
+    keys: List[date] = field(default_factory=list)
+    buckets: Dict[date, Dict[str, AggregateStats]] = field(default_factory=dict)
+
+
+def _bucket_start(level: str, d: date) -> date:
+    if level == "weekly":
+        return d - timedelta(days=d.weekday())
+    if level == "monthly":
+        return d.replace(day=1)
+    return d
+
+
+def _next_month(d: date) -> date:
+    return date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
+
+
+def _as_date(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _as_datetime(value: Union[date, datetime]) -> datetime:
+    return value if isinstance(value, datetime) else datetime.combine(value, datetime.min.time())
+
+
+class TimeSeriesPyramid:
+    """Daily / weekly / monthly pre-aggregates of a single region's time series.
+
+    Samples (of any frequency, e.g. hourly) are folded into every level on
+    ingest, so the raw history never needs to be kept. Samples may arrive in
+    any order (e.g. backfilling history newest-first); the caller must not
+    ingest the same sample twice.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields = tuple(fields)
+        self.levels: Dict[str, _Level] = {name: _Level() for name, _ in LEVELS}
+        self.last_timestamp: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    # -------- ingestion ----------
+    def ingest(self, timestamp: Union[date, datetime], values: Dict[str, float]):
+        """Fold one sample into all levels."""
+        timestamp = _as_datetime(timestamp)
+        day = timestamp.date()
+        with self._lock:
+            for name, level in self.levels.items():
+                key = _bucket_start(name, day)
+                bucket = level.buckets.get(key)
+                if bucket is None:
+                    bucket = {f: AggregateStats() for f in self.fields}
+                    level.buckets[key] = bucket
+                    if not level.keys or key > level.keys[-1]:
+                        level.keys.append(key)
+                    else:
+                        bisect.insort(level.keys, key)
+                for f in self.fields:
+                    value = values.get(f)
+                    if value is not None and not math.isnan(value):
+                        bucket[f].add(float(value))
+            if self.last_timestamp is None or timestamp > self.last_timestamp:
+                self.last_timestamp = timestamp
+
+    # -------- queries ----------
+    @staticmethod
+    def resolve_level(resolution: Union[str, int, timedelta]) -> str:
+        """Coarsest level whose buckets are no wider than ``resolution``."""
+        if isinstance(resolution, str):
+            if resolution not in dict(LEVELS):
+                raise ValueError(f"Unknown resolution '{resolution}', expected one of {[n for n, _ in LEVELS]}")
+            return resolution
+        days = resolution.days if isinstance(resolution, timedelta) else int(resolution)
+        if days < 1:
+            raise ValueError("Resolution must be at least one day")
+        chosen = LEVELS[0][0]
+        for name, width in LEVELS:
+            if width <= days:
+                chosen = name
+        return chosen
+
+    def query(
+        self,
+        start: Union[date, datetime],
+        end: Union[date, datetime],
+        resolution: Union[str, int, timedelta] = "daily",
+    ) -> List[Dict]:
+        """Buckets whose start falls in ``[start, end)``, served from the coarsest fitting level."""
+        name = self.resolve_level(resolution)
+        level = self.levels[name]
+        start_d, end_d = _as_date(start), _as_date(end)
+        with self._lock:
+            lo = bisect.bisect_left(level.keys, start_d)
+            hi = bisect.bisect_left(level.keys, end_d)
+            out = []
+            for key in level.keys[lo:hi]:
+                row = {"start": key, "resolution": name}
+                for f, stats in level.buckets[key].items():
+                    row[f] = stats.to_dict()
+                out.append(row)
+        return out
+
+    def summarize(self, start: Union[date, datetime], end: Union[date, datetime]) -> Dict[str, Dict]:
+        """Aggregate over ``[start, end)`` in O(buckets).
+
+        Whole months are taken from the monthly level, whole weeks from the
+        weekly level, and only the ragged edges from the daily level.
+        """
+        start_d, end_d = _as_date(start), _as_date(end)
+        totals = {f: AggregateStats() for f in self.fields}
+        with self._lock:
+            cursor = start_d
+            while cursor < end_d:
+                if cursor.day == 1 and _next_month(cursor) <= end_d:
+                    name, step = "monthly", _next_month(cursor)
+                elif cursor.weekday() == 0 and cursor + timedelta(days=7) <= end_d:
+                    name, step = "weekly", cursor + timedelta(days=7)
+                else:
+                    name, step = "daily", cursor + timedelta(days=1)
+                bucket = self.levels[name].buckets.get(cursor)
+                if bucket is not None:
+                    for f, stats in bucket.items():
+                        totals[f].merge(stats)
+                cursor = step
+        return {f: stats.to_dict() for f, stats in totals.items()}
+
+    def climatology(self) -> Dict[int, Dict[str, Dict]]:
+        """Long-term statistics per calendar month (1-12), merged from the monthly level."""
+        totals: Dict[int, Dict[str, AggregateStats]] = {}
+        with self._lock:
+            for key, bucket in self.levels["monthly"].buckets.items():
+                month = totals.setdefault(key.month, {f: AggregateStats() for f in self.fields})
+                for f, stats in bucket.items():
+                    month[f].merge(stats)
+        return {
+            m: {f: stats.to_dict() for f, stats in fields.items()}
+            for m, fields in sorted(totals.items())
+        }
@@ -0,0 +1,105 @@
+import math
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from models.timeseries_pyramid import TimeSeriesPyramid
+
+
+def _hourly_samples(start: datetime, days: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [(start + timedelta(hours=h), rng.gauss(0, 1)) for h in range(24 * days)]
+
+
+def _ingest(samples):
+    pyramid = TimeSeriesPyramid(("t",))
+    for ts, value in samples:
+        pyramid.ingest(ts, {"t": value})
+    return pyramid
+
+
+def _assert_matches(stats, values):
+    assert stats["count"] == len(values)
+    assert math.isclose(stats["sum"], sum(values), abs_tol=1e-9)
+    assert stats["min"] == min(values)
+    assert stats["max"] == max(values)
+
+
+def test_summarize_matches_brute_force_across_month_boundaries():
+    samples = _hourly_samples(datetime(2023, 1, 20, 5), days=120)
+    pyramid = _ingest(samples)
+    # Ragged start, several whole months and weeks, ragged end
+    for start, end in [
+        (date(2023, 1, 25), date(2023, 2, 3)),
+        (date(2023, 1, 28), date(2023, 4, 17)),
+        (date(2023, 2, 1), date(2023, 3, 1)),
+        (date(2023, 3, 6), date(2023, 3, 13)),
+    ]:
+        expected = [v for ts, v in samples if start <= ts.date() < end]
+        _assert_matches(pyramid.summarize(start, end)["t"], expected)
+
+
+def test_out_of_order_ingest_matches_in_order():
+    samples = _hourly_samples(datetime(2022, 11, 1), days=90, seed=1)
+    in_order = _ingest(samples)
+    shuffled = list(samples)
+    random.Random(2).shuffle(shuffled)
+    backfilled = _ingest(shuffled)
+
+    for name in ("daily", "weekly", "monthly"):
+        assert backfilled.levels[name].keys == sorted(backfilled.levels[name].keys)
+        assert backfilled.levels[name].keys == in_order.levels[name].keys
+    assert backfilled.last_timestamp == samples[-1][0]
+    start, end = date(2022, 11, 9), date(2023, 1, 20)
+    expected = [v for ts, v in samples if start <= ts.date() < end]
+    _assert_matches(backfilled.summarize(start, end)["t"], expected)
+
+
+def test_ingest_accepts_dates_and_datetimes():
+    pyramid = TimeSeriesPyramid(("t",))
+    pyramid.ingest(date(2023, 1, 1), {"t": 1.0})
+    pyramid.ingest(datetime(2023, 1, 2, 6), {"t": 2.0})
+    pyramid.ingest(date(2022, 12, 31), {"t": 3.0})
+    assert pyramid.last_timestamp == datetime(2023, 1, 2, 6)
+    assert [row["start"] for row in pyramid.query(date(2022, 1, 1), date(2024, 1, 1), "monthly")] == [
+        date(2022, 12, 1),
+        date(2023, 1, 1),
+    ]
+
+
+def test_query_serves_coarsest_fitting_level():
+    pyramid = _ingest(_hourly_samples(datetime(2023, 1, 1), days=60))
+    rows = pyramid.query(date(2023, 1, 1), date(2023, 3, 1), 45)
+    assert [row["start"] for row in rows] == [date(2023, 1, 1), date(2023, 2, 1)]
+    assert all(row["resolution"] == "monthly" for row in rows)
+    assert rows[0]["t"]["count"] == 31 * 24
+
+
+def test_climatology_groups_by_calendar_month():
+    samples = _hourly_samples(datetime(2020, 1, 1), days=3 * 365, seed=3)
+    climatology = _ingest(samples).climatology()
+    assert sorted(climatology) == list(range(1, 13))
+    _assert_matches(climatology[2]["t"], [v for ts, v in samples if ts.month == 2])
+
+
+@pytest.mark.parametrize(
+    "resolution, expected",
+    [
+        (1, "daily"),
+        (6, "daily"),
+        (7, "weekly"),
+        (30, "weekly"),
+        (31, "monthly"),
+        (timedelta(days=365), "monthly"),
+        ("weekly", "weekly"),
+    ],
+)
+def test_resolve_level(resolution, expected):
+    assert TimeSeriesPyramid.resolve_level(resolution) == expected
+
+
+@pytest.mark.parametrize("resolution", ["hourly", 0, timedelta(hours=6)])
+def test_resolve_level_rejects_invalid(resolution):
+    with pytest.raises(ValueError):
+        TimeSeriesPyramid.resolve_level(resolution)